@@ -0,0 +1,203 @@
+"""
+On-disk cache of GraphUpdater results keyed by project content.
+
+When ``CODE_GRAPH_RAG_INCREMENTAL=1`` is set, GraphUpdater fingerprints the
+project sources together with the graph state it starts from (definitions
+preloaded from other projects and pending cross-project calls). A rerun with
+an identical fingerprint replays the recorded nodes and relationships instead
+of parsing the project again.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+INCREMENTAL_ENV_VAR = "CODE_GRAPH_RAG_INCREMENTAL"
+CACHE_DIR = Path.home() / ".cache" / "code-graph-rag" / "graphs_v1"
+# Least recently used entries beyond this many are deleted after each store.
+MAX_CACHE_ENTRIES = 256
+
+
+@dataclass
+class CachedGraph:
+    """Everything a GraphUpdater run emitted, in emission order."""
+
+    nodes: list[tuple[str, dict[str, Any]]]
+    relationships: list[
+        tuple[tuple[str, str, str], str, tuple[str, str, str], dict[str, Any] | None]
+    ]
+    pending_calls: list[dict[str, Any]] = field(default_factory=list)
+    definitions: dict[str, str] = field(default_factory=dict)
+    simple_names: dict[str, list[str]] = field(default_factory=dict)
+
+
+class RecordingIngestor:
+    """Ingestor proxy that remembers every node and relationship written through it."""
+
+    def __init__(self, ingestor: Any) -> None:
+        self._ingestor = ingestor
+        self.nodes: list[tuple[str, dict[str, Any]]] = []
+        self.relationships: list[
+            tuple[
+                tuple[str, str, str], str, tuple[str, str, str], dict[str, Any] | None
+            ]
+        ] = []
+
+    def ensure_node_batch(self, label: str, properties: dict[str, Any]) -> None:
+        self.nodes.append((label, properties))
+        self._ingestor.ensure_node_batch(label, properties)
+
+    def ensure_relationship_batch(
+        self,
+        from_spec: tuple[str, str, Any],
+        rel_type: str,
+        to_spec: tuple[str, str, Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        # Forward the call exactly as made; only the record is normalized.
+        properties = kwargs.get("properties", args[0] if args else None)
+        self.relationships.append((from_spec, rel_type, to_spec, properties))
+        self._ingestor.ensure_relationship_batch(
+            from_spec, rel_type, to_spec, *args, **kwargs
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ingestor, name)
+
+
+def incremental_enabled() -> bool:
+    """Return True when graph caching has been opted into via the environment."""
+
+    return os.environ.get(INCREMENTAL_ENV_VAR) == "1"
+
+
+@cache
+def tool_versions() -> str:
+    """Versions of this package and every tree-sitter distribution, as one string.
+
+    Folded into each fingerprint so that upgrading the parser or a grammar
+    never replays a graph produced by the old one.
+    """
+
+    versions = []
+    for dist in metadata.distributions():
+        name = (dist.metadata["Name"] or "").lower().replace("_", "-")
+        if name == "graph-code" or name.startswith("tree-sitter"):
+            versions.append(f"{name}=={dist.version}")
+    return ";".join(sorted(set(versions)))
+
+
+def compute_project_fingerprint(
+    repo_path: Path,
+    ignore_dirs: Iterable[str] = (),
+    context: Iterable[str] = (),
+) -> str:
+    """Hash every non-ignored file under ``repo_path`` plus extra context strings."""
+
+    ignored = set(ignore_dirs)
+    files = sorted(
+        (path.relative_to(repo_path).as_posix(), path)
+        for path in repo_path.rglob("*")
+        if path.is_file() and ignored.isdisjoint(path.relative_to(repo_path).parts)
+    )
+
+    digest = hashlib.sha256()
+    digest.update(tool_versions().encode("utf-8") + b"\0")
+    digest.update(repo_path.name.encode("utf-8") + b"\0")
+    for relative_path, path in files:
+        digest.update(relative_path.encode("utf-8") + b"\0")
+        digest.update(path.read_bytes() + b"\0")
+    for item in context:
+        digest.update(item.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def pending_calls_context(pending_calls: Iterable[dict[str, Any]]) -> list[str]:
+    """Serialize pending calls into stable strings for a fingerprint."""
+
+    return sorted(
+        json.dumps(pending, sort_keys=True, default=str) for pending in pending_calls
+    )
+
+
+def load_cached_graph(fingerprint: str) -> CachedGraph | None:
+    """Return the cached graph for ``fingerprint``, or None on a miss."""
+
+    cache_file = CACHE_DIR / f"{fingerprint}.pickle"
+    try:
+        with cache_file.open("rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.debug(f"Ignoring unreadable graph cache {cache_file}: {exc}")
+        return None
+
+    if not isinstance(cached, CachedGraph):
+        return None
+    # Refresh the mtime so eviction treats this entry as recently used.
+    try:
+        os.utime(cache_file)
+    except OSError:
+        pass
+    return cached
+
+
+def store_cached_graph(
+    fingerprint: str,
+    ingestor: RecordingIngestor,
+    definitions: Mapping[str, str] | None = None,
+    simple_names: Mapping[str, Iterable[str]] | None = None,
+) -> None:
+    """Persist what ``ingestor`` recorded under ``fingerprint``."""
+
+    pending_calls: list[dict[str, Any]] = []
+    if hasattr(ingestor, "get_pending_calls"):
+        pending_calls = list(ingestor.get_pending_calls())
+
+    cached = CachedGraph(
+        nodes=ingestor.nodes,
+        relationships=ingestor.relationships,
+        pending_calls=pending_calls,
+        definitions=dict(definitions or {}),
+        simple_names={name: sorted(qns) for name, qns in (simple_names or {}).items()},
+    )
+
+    cache_file = CACHE_DIR / f"{fingerprint}.pickle"
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tmp_file.open("wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception as exc:
+        logger.debug(f"Failed to write graph cache {cache_file}: {exc}")
+        tmp_file.unlink(missing_ok=True)
+        return
+
+    _evict_stale_entries()
+
+
+def _evict_stale_entries() -> None:
+    """Delete the least recently used entries beyond MAX_CACHE_ENTRIES."""
+
+    entries: list[tuple[float, Path]] = []
+    for path in CACHE_DIR.glob("*.pickle"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+
+    entries.sort(reverse=True)
+    for _, path in entries[MAX_CACHE_ENTRIES:]:
+        path.unlink(missing_ok=True)
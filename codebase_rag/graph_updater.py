@@ -8,14 +8,23 @@ splitting the monolithic class into logical components.
 import re
 import sys
 from collections import OrderedDict, defaultdict
-from collections.abc import ItemsView, KeysView
+from collections.abc import ItemsView, Iterable, KeysView
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from loguru import logger
 from tree_sitter import Node, Parser
 
 from .config import IGNORE_PATTERNS
+from .graph_cache import (
+    CachedGraph,
+    RecordingIngestor,
+    compute_project_fingerprint,
+    incremental_enabled,
+    load_cached_graph,
+    pending_calls_context,
+    store_cached_graph,
+)
 from .language_config import get_language_config
 from .parsers.factory import ProcessorFactory
 from .services.graph_service import MemgraphIngestor
@@ -45,6 +54,38 @@ class FunctionRegistryTrie:
         current["__type__"] = func_type
         current["__qn__"] = qualified_name
 
+    def bulk_insert(self, items: Iterable[tuple[str, str]]) -> None:
+        """Insert many functions, sharing trie walks between adjacent keys.
+
+        Args:
+            items: (qualified_name, func_type) pairs. Later duplicates win,
+                matching repeated calls to insert().
+        """
+        path: list[dict[str, Any]] = [self.root]
+        previous_parts: list[str] = []
+
+        for qualified_name, func_type in sorted(items, key=lambda item: item[0]):
+            self._entries[qualified_name] = func_type
+            parts = qualified_name.split(".")
+
+            # Reuse the nodes already walked for the prefix shared with the
+            # previous (sorted) key instead of descending from the root again.
+            shared = 0
+            for previous, part in zip(previous_parts, parts):
+                if previous != part:
+                    break
+                shared += 1
+            del path[shared + 1 :]
+
+            current = path[-1]
+            for part in parts[shared:]:
+                current = current.setdefault(part, {})
+                path.append(current)
+
+            current["__type__"] = func_type
+            current["__qn__"] = qualified_name
+            previous_parts = parts
+
     def get(self, qualified_name: str, default: str | None = None) -> str | None:
         """Get function type by exact qualified name."""
         return self._entries.get(qualified_name, default)
@@ -235,8 +276,16 @@ class GraphUpdater:
         repo_path: Path,
         parsers: dict[str, Parser],
         queries: dict[str, Any],
+        incremental: bool | None = None,
     ):
-        self.ingestor = ingestor
+        # With incremental mode on, record what this run emits so an identical
+        # rerun can replay it from the graph cache. A replay restores only the
+        # graph writes, not ASTs or processor state, so long-lived callers that
+        # keep reprocessing after run() must pass incremental=False.
+        self.incremental = incremental_enabled() if incremental is None else incremental
+        self.ingestor: MemgraphIngestor | RecordingIngestor = (
+            RecordingIngestor(ingestor) if self.incremental else ingestor
+        )
         self.repo_path = repo_path
         self.parsers = parsers
         self.queries = self._prepare_queries_with_parsers(queries, parsers)
@@ -248,7 +297,8 @@ class GraphUpdater:
 
         # Create processor factory with all dependencies
         self.factory = ProcessorFactory(
-            ingestor=self.ingestor,
+            # The recording proxy forwards the full MemgraphIngestor API.
+            ingestor=cast(MemgraphIngestor, self.ingestor),
             repo_path_getter=lambda: self.repo_path,
             project_name_getter=lambda: self.project_name,
             queries=self.queries,
@@ -303,6 +353,8 @@ class GraphUpdater:
         if not isinstance(results, list):
             return
 
+        preloaded: dict[str, str] = {}
+
         for row in results:
             if not isinstance(row, dict):
                 continue
@@ -321,13 +373,15 @@ class GraphUpdater:
             if not node_type:
                 continue
 
-            if qualified_name in self.function_registry:
+            if qualified_name in self.function_registry or qualified_name in preloaded:
                 continue
 
-            self.function_registry[qualified_name] = node_type
+            preloaded[qualified_name] = node_type
             simple_name = qualified_name.split(".")[-1]
             self.simple_name_lookup[simple_name].add(qualified_name)
 
+        self.function_registry.bulk_insert(preloaded.items())
+
     def _is_dependency_file(self, file_name: str, filepath: Path) -> bool:
         """Check if a file is a dependency file that should be processed for external dependencies."""
         dependency_files = {
@@ -364,6 +418,15 @@ class GraphUpdater:
 
     def run(self) -> None:
         """Orchestrates the parsing and ingestion process."""
+        fingerprint = self._graph_fingerprint() if self.incremental else None
+        if fingerprint is not None:
+            cached = load_cached_graph(fingerprint)
+            if cached is not None:
+                logger.info(f"--- Reusing cached graph for {self.project_name} ---")
+                self._replay_cached_graph(cached)
+                self.ingestor.flush_all()
+                return
+
         self.ingestor.ensure_node_batch("Project", {"name": self.project_name})
         logger.info(f"Ensuring Project: {self.project_name}")
 
@@ -388,6 +451,41 @@ class GraphUpdater:
         logger.info("\n--- Analysis complete. Flushing all data to database... ---")
         self.ingestor.flush_all()
 
+        if fingerprint is not None and isinstance(self.ingestor, RecordingIngestor):
+            store_cached_graph(
+                fingerprint,
+                self.ingestor,
+                dict(self.function_registry.items()),
+                self.simple_name_lookup,
+            )
+
+    def _graph_fingerprint(self) -> str:
+        """Fingerprint the sources and the graph state this run starts from."""
+
+        context = [
+            f"{qn}:{node_type}"
+            for qn, node_type in sorted(self.function_registry.items())
+        ]
+        if hasattr(self.ingestor, "get_pending_calls"):
+            context.extend(pending_calls_context(self.ingestor.get_pending_calls()))
+        return compute_project_fingerprint(self.repo_path, self.ignore_dirs, context)
+
+    def _replay_cached_graph(self, cached: CachedGraph) -> None:
+        """Re-emit a cached run into the ingestor and restore in-memory lookups."""
+
+        for label, node_properties in cached.nodes:
+            self.ingestor.ensure_node_batch(label, node_properties)
+        for from_spec, rel_type, to_spec, rel_properties in cached.relationships:
+            self.ingestor.ensure_relationship_batch(
+                from_spec, rel_type, to_spec, rel_properties
+            )
+        if hasattr(self.ingestor, "replace_pending_calls"):
+            self.ingestor.replace_pending_calls(cached.pending_calls)
+
+        self.function_registry.bulk_insert(cached.definitions.items())
+        for simple_name, qns in cached.simple_names.items():
+            self.simple_name_lookup[simple_name].update(qns)
+
     def remove_file_from_state(self, file_path: Path) -> None:
         """Removes all state associated with a file from the updater's memory."""
         logger.debug(f"Removing in-memory state for: {file_path}")
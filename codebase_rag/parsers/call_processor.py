@@ -117,6 +117,7 @@ class CallProcessor:
         self._cross_project_lookup_cache: dict[
             tuple[str, str], tuple[str, str] | None
         ] = {}
+        self._cross_project_candidate_cache: dict[str, list[str]] = {}
 
     def process_calls_in_file(
         self, file_path: Path, root_node: Node, language: str, queries: dict[str, Any]
@@ -1293,6 +1294,10 @@ class CallProcessor:
     def _generate_cross_project_candidates(self, imported_qn: str) -> list[str]:
         """Generate normalized qualified name candidates for cross-project lookup."""
 
+        cached = self._cross_project_candidate_cache.get(imported_qn)
+        if cached is not None:
+            return list(cached)
+
         base = imported_qn.strip()
         if not base:
             return []
@@ -1314,7 +1319,9 @@ class CallProcessor:
                     simple = class_path.split(".")[-1]
                     variants.add(f"{class_path}.{simple}.{method}")
 
-        return [candidate for candidate in variants if candidate]
+        candidates = [candidate for candidate in variants if candidate]
+        self._cross_project_candidate_cache[imported_qn] = candidates
+        return list(candidates)
 
     def _lookup_cross_project_definition(
         self, imported_qn: str, module_qn: str
@@ -1363,74 +1370,68 @@ class CallProcessor:
             self._cross_project_lookup_cache[cache_key] = None
             return None
 
-        batch_size = 100
-
-        for start in range(0, len(candidates), batch_size):
-            batch = candidates[start : start + batch_size]
-            try:
-                rows = self.ingestor.fetch_all(
-                    (
-                        "MATCH (n) "
-                        "WHERE n.qualified_name IN $qualified_names "
-                        "AND any(label IN labels(n) WHERE label IN $allowed_labels) "
-                        "RETURN n.qualified_name AS qualified_name, labels(n) AS labels"
-                    ),
-                    {
-                        "qualified_names": batch,
-                        "allowed_labels": allowed_labels,
-                    },
-                )
-            except Exception:
-                rows = []
-
-            for candidate in batch:
-                resolved = self._select_cross_project_candidate(
-                    rows,
-                    allowed_labels,
-                    exact_match=candidate,
-                    caller_java_prefix=caller_prefix,
-                )
-                if resolved:
-                    self._cross_project_lookup_cache[cache_key] = resolved
-                    return resolved
-
         suffix_lookup = []
         for candidate in candidates:
             suffix = candidate if candidate.startswith(".") else f".{candidate}"
             suffix_lookup.append((candidate, suffix))
 
-        unique_suffixes = list({suffix for _, suffix in suffix_lookup})
+        # Exact and suffix matches are fetched together so each batch costs a
+        # single round-trip; exact matches are still preferred when ranking.
+        batch_size = 100
+        exact_rows: list[Any] = []
+        rows: list[Any] = []
 
-        for start in range(0, len(unique_suffixes), batch_size):
-            suffix_batch = unique_suffixes[start : start + batch_size]
+        for start in range(0, len(suffix_lookup), batch_size):
+            batch = suffix_lookup[start : start + batch_size]
+            qualified_names = [candidate for candidate, _ in batch]
             try:
-                rows = self.ingestor.fetch_all(
+                batch_rows = self.ingestor.fetch_all(
                     (
                         "MATCH (n) "
-                        "WHERE any(suffix IN $suffixes WHERE n.qualified_name ENDS WITH suffix) "
+                        "WHERE (n.qualified_name IN $qualified_names "
+                        "OR any(suffix IN $suffixes WHERE n.qualified_name ENDS WITH suffix)) "
                         "AND any(label IN labels(n) WHERE label IN $allowed_labels) "
                         "RETURN n.qualified_name AS qualified_name, labels(n) AS labels"
                     ),
-                    {"suffixes": suffix_batch, "allowed_labels": allowed_labels},
+                    {
+                        "qualified_names": qualified_names,
+                        "suffixes": list({suffix for _, suffix in batch}),
+                        "allowed_labels": allowed_labels,
+                    },
                 )
             except Exception:
-                rows = []
+                batch_rows = []
 
-            if not rows:
+            if not isinstance(batch_rows, list):
                 continue
 
-            for candidate, suffix in suffix_lookup:
-                if suffix not in suffix_batch:
-                    continue
-                resolved = self._select_cross_project_candidate(
-                    rows,
-                    allowed_labels,
-                    suffix=suffix,
-                    caller_java_prefix=caller_prefix,
-                )
-                if resolved:
-                    self._cross_project_lookup_cache[cache_key] = resolved
-                    return resolved
+            exact_names = set(qualified_names)
+            for row in batch_rows:
+                rows.append(row)
+                if isinstance(row, dict) and row.get("qualified_name") in exact_names:
+                    exact_rows.append(row)
+
+        for candidate, _ in suffix_lookup:
+            resolved = self._select_cross_project_candidate(
+                exact_rows,
+                allowed_labels,
+                exact_match=candidate,
+                caller_java_prefix=caller_prefix,
+            )
+            if resolved:
+                self._cross_project_lookup_cache[cache_key] = resolved
+                return resolved
+
+        for _, suffix in suffix_lookup:
+            resolved = self._select_cross_project_candidate(
+                rows,
+                allowed_labels,
+                suffix=suffix,
+                caller_java_prefix=caller_prefix,
+            )
+            if resolved:
+                self._cross_project_lookup_cache[cache_key] = resolved
+                return resolved
 
         self._cross_project_lookup_cache[cache_key] = None
         return None
@@ -0,0 +1,338 @@
+"""In-memory stand-in for MemgraphIngestor shared by integration-style tests."""
+
+from __future__ import annotations
+
+import sys
+from bisect import bisect_left
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from typing import cast
+
+Relationship = tuple[tuple[str, str, str], str, tuple[str, str, str], dict | None]
+RelationshipFilter = Callable[[tuple[str, str, str], str, tuple[str, str, str]], bool]
+
+
+class InMemoryIngestor:
+    """Minimal MemgraphIngestor replacement for integration-style tests.
+
+    ``relationship_filter`` is called with (from_spec, rel_type, to_spec) and
+    relationships it rejects are dropped before they are stored or indexed,
+    for tests that only ever assert on a subset of edges.
+    """
+
+    def __init__(self, relationship_filter: RelationshipFilter | None = None) -> None:
+        self._relationship_filter = relationship_filter
+        self.nodes: deque[tuple[str, dict[str, object]]] = deque()
+        self.nodes_by_label: dict[str, dict[str, dict[str, object]]] = {}
+        self.nodes_by_qn: defaultdict[str, dict[str, dict[str, object]]] = defaultdict(
+            dict
+        )
+        self._suffix_index: dict[str, set[tuple[str, str]]] = {}
+        # Sorted qualified names per label, built on the first prefix query
+        # for that label and dropped when the label gains a node.
+        self._sorted_qns: dict[str, list[str]] = {}
+        self.relationships: deque[Relationship] = deque()
+        # Bound once: these run for every node and relationship GraphUpdater emits.
+        self._nodes_append = self.nodes.append
+        self._rels_append = self.relationships.append
+        # CALLS targets as flat (caller_label, callee_label, callee_qn) rows
+        # keyed by caller qualified name, so find_calls_from never unpacks
+        # the nested relationship tuples.
+        self._calls_from_qn: defaultdict[str, list[tuple[str, str, str]]] = defaultdict(
+            list
+        )
+        self.pending_calls: list[dict[str, object]] = []
+        self._pending_keys: set[tuple[object, ...]] = set()
+        self.fetch_queries: list[tuple[str, dict[str, object] | None]] = []
+
+    def ensure_node_batch(self, label: str, properties: dict[str, object]) -> None:
+        self._nodes_append((label, properties))
+        self._index_node(label, properties)
+
+    def ensure_nodes_batch(
+        self, items: Iterable[tuple[str, dict[str, object]]]
+    ) -> None:
+        """Add several (label, properties) nodes in one call."""
+
+        items = list(items)
+        self.nodes.extend(items)
+        for label, properties in items:
+            self._index_node(label, properties)
+
+    def _index_node(self, label: str, properties: dict[str, object]) -> None:
+        """Index a node by label, qualified name and final name segment.
+
+        Only string qualified names are indexed, which is what lets fetch_all
+        and _match_suffixes read the indexes without per-node type checks.
+        The qualified name is interned and written back into ``properties``,
+        so callers must not replace it after the node is ingested.
+        """
+
+        qualified_name = properties.get("qualified_name")
+        if not isinstance(qualified_name, str):
+            return
+        qualified_name = properties["qualified_name"] = sys.intern(qualified_name)
+
+        by_qn = self.nodes_by_label.setdefault(label, {})
+        if qualified_name not in by_qn:
+            self._sorted_qns.pop(label, None)
+        by_qn[qualified_name] = properties
+        self.nodes_by_qn[qualified_name][label] = properties
+        last_segment = qualified_name.rsplit(".", 1)[-1]
+        self._suffix_index.setdefault(last_segment, set()).add((label, qualified_name))
+
+    def ensure_relationship_batch(
+        self,
+        from_spec: tuple[str, str, str],
+        rel_type: str,
+        to_spec: tuple[str, str, str],
+        properties: dict | None = None,
+    ) -> None:
+        if self._relationship_filter is not None and not self._relationship_filter(
+            from_spec, rel_type, to_spec
+        ):
+            return
+        rel = (_intern_spec(from_spec), rel_type, _intern_spec(to_spec), properties)
+        self._rels_append(rel)
+        self._index_relationship(rel)
+
+    def ensure_relationships_batch(self, items: Iterable[Relationship]) -> None:
+        """Add several (from_spec, rel_type, to_spec, properties) relationships."""
+
+        keep = self._relationship_filter
+        items = [
+            (_intern_spec(from_spec), rel_type, _intern_spec(to_spec), properties)
+            for from_spec, rel_type, to_spec, properties in items
+            if keep is None or keep(from_spec, rel_type, to_spec)
+        ]
+        self.relationships.extend(items)
+        for rel in items:
+            self._index_relationship(rel)
+
+    def _index_relationship(self, rel: Relationship) -> None:
+        if rel[1] == "CALLS":
+            (from_label, _, from_qn), _, (to_label, _, to_qn), _ = rel
+            self._calls_from_qn[from_qn].append((from_label, to_label, to_qn))
+
+    def find_calls_from(
+        self, qualified_name: str, label: str | None = None
+    ) -> list[tuple[str, str]]:
+        """Return (label, qualified_name) of each CALLS target of a caller."""
+
+        return [
+            (to_label, to_qn)
+            for from_label, to_label, to_qn in self._calls_from_qn.get(
+                qualified_name, ()
+            )
+            if label is None or from_label == label
+        ]
+
+    def flush_all(self) -> None:  # pragma: no cover - no-op for tests
+        return
+
+    def fetch_all(
+        self, query: str, params: dict | None = None
+    ) -> list[dict[str, object]]:
+        params = _normalize_params(params)
+        self.fetch_queries.append((query, params))
+        results: list[dict[str, object]] = []
+
+        allowed: frozenset[str] | None = None
+        qualified_names: frozenset[str] | None = None
+        suffixes: frozenset[str] | None = None
+        prefix: str | None = None
+
+        if params:
+            allowed = params.get("allowed_labels") or None
+            if isinstance(params.get("qualified_name_prefix"), str):
+                prefix = params["qualified_name_prefix"]
+
+            if "qualified_name" in params and isinstance(params["qualified_name"], str):
+                qualified_names = frozenset({params["qualified_name"]})
+            elif isinstance(params.get("qualified_names"), frozenset):
+                qualified_names = params["qualified_names"]
+
+            if "suffix" in params and isinstance(params["suffix"], str):
+                suffixes = frozenset({params["suffix"]})
+            elif isinstance(params.get("suffixes"), frozenset):
+                suffixes = params["suffixes"]
+
+        if qualified_names is not None or suffixes is not None:
+            # Exact and suffix filters are disjunctive, mirroring the combined
+            # cross-project lookup query. Exact-match batches are highly
+            # selective, so walk the requested names rather than stored labels,
+            # sorted so results do not depend on frozenset iteration order.
+            matches: dict[tuple[str, str], None] = {}
+            if qualified_names is not None:
+                for qualified_name in sorted(qualified_names):
+                    for label in self.nodes_by_qn.get(qualified_name, ()):
+                        matches[(label, qualified_name)] = None
+            if suffixes is not None:
+                matches.update(dict.fromkeys(self._match_suffixes(suffixes)))
+
+            for label, qualified_name in matches:
+                if allowed is not None and label not in allowed:
+                    continue
+                if prefix is not None and not qualified_name.startswith(prefix):
+                    continue
+                results.append({"qualified_name": qualified_name, "labels": [label]})
+            return results
+
+        if allowed is None:
+            labels = list(self.nodes_by_label)
+        else:
+            # Sorted so results do not depend on frozenset iteration order.
+            labels = sorted(allowed.intersection(self.nodes_by_label))
+
+        for label in labels:
+            if prefix is None:
+                qualified_names_iter: Iterable[str] = self.nodes_by_label[label]
+            else:
+                qualified_names_iter = self.iter_qualified_names_with_prefix(
+                    label, prefix
+                )
+            for qualified_name in qualified_names_iter:
+                results.append({"qualified_name": qualified_name, "labels": [label]})
+        return results
+
+    def iter_qualified_names_with_prefix(
+        self, label: str, prefix: str
+    ) -> Iterator[str]:
+        """Yield the sorted qualified names of ``label`` that start with ``prefix``."""
+
+        qualified_names = self._sorted_qns.get(label)
+        if qualified_names is None:
+            qualified_names = self._sorted_qns[label] = sorted(
+                self.nodes_by_label.get(label, ())
+            )
+        for index in range(bisect_left(qualified_names, prefix), len(qualified_names)):
+            qualified_name = qualified_names[index]
+            if not qualified_name.startswith(prefix):
+                return
+            yield qualified_name
+
+    def _match_suffixes(self, suffixes: frozenset[str]) -> list[tuple[str, str]]:
+        """Return sorted (label, qualified_name) pairs ending with any suffix."""
+
+        matches: set[tuple[str, str]] = set()
+        for suffix in suffixes:
+            if "." in suffix:
+                # A dotted suffix shares its final segment with every match, so
+                # only that bucket of the index needs the endswith check.
+                candidates: Iterable[tuple[str, str]] = self._suffix_index.get(
+                    suffix.rsplit(".", 1)[1], ()
+                )
+            else:
+                candidates = (
+                    (label, qualified_name)
+                    for label, by_qn in self.nodes_by_label.items()
+                    for qualified_name in by_qn
+                )
+            matches.update(pair for pair in candidates if pair[1].endswith(suffix))
+        return sorted(matches)
+
+    def execute_write(
+        self, query: str, params: dict | None = None
+    ) -> None:  # pragma: no cover - unused
+        return
+
+    def record_pending_call(self, pending: dict[str, object]) -> None:
+        key = _pending_key(pending)
+        if key in self._pending_keys:
+            return
+        self._pending_keys.add(key)
+        self.pending_calls.append(pending)
+
+    def get_pending_calls(self) -> list[dict[str, object]]:
+        """Return the live pending list; callers must copy before mutating it."""
+
+        return self.pending_calls
+
+    def replace_pending_calls(self, pending_calls: list[dict[str, object]]) -> None:
+        """Adopt ``pending_calls`` without copying and rebuild the dedup keys."""
+
+        self.pending_calls = pending_calls
+        self._pending_keys = {_pending_key(item) for item in pending_calls}
+
+
+_SET_PARAMS = ("qualified_names", "suffixes", "allowed_labels")
+
+
+def _normalize_params(params: dict | None) -> dict | None:
+    """Copy query params once, turning list-valued filters into frozensets."""
+
+    if params is None:
+        return None
+
+    normalized = dict(params)
+    for key in _SET_PARAMS:
+        value = normalized.get(key)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            normalized[key] = frozenset(item for item in value if isinstance(item, str))
+    return normalized
+
+
+def _intern_spec(spec: tuple[str, str, str]) -> tuple[str, str, str]:
+    """Intern the key value of a (label, key, value) node spec."""
+
+    label, key, value = spec
+    if isinstance(value, str):
+        return (label, key, sys.intern(value))
+    return spec
+
+
+def _pending_key(pending: dict[str, object]) -> tuple[object, ...]:
+    """Deduplication key for pending calls, matching MemgraphIngestor."""
+
+    candidates = cast(list[str], pending.get("candidates") or [])
+    return (
+        pending.get("caller_type"),
+        pending.get("caller_qn"),
+        pending.get("call_name"),
+        tuple(sorted(candidates)),
+    )
+
+
+class CaptureIngestor:
+    """Append-only ingestor for tests that only inspect what was emitted.
+
+    Unlike a MagicMock it records no call objects, and unlike
+    InMemoryIngestor it builds no indexes and answers every query with no
+    rows, so nothing is preloaded from earlier projects.
+    """
+
+    __slots__ = ("nodes", "rels", "pending")
+
+    def __init__(self) -> None:
+        self.nodes: list[tuple[str, dict[str, object]]] = []
+        self.rels: list[Relationship] = []
+        self.pending: list[dict[str, object]] = []
+
+    def ensure_node_batch(self, label: str, properties: dict[str, object]) -> None:
+        self.nodes.append((label, properties))
+
+    def ensure_relationship_batch(
+        self,
+        from_spec: tuple[str, str, str],
+        rel_type: str,
+        to_spec: tuple[str, str, str],
+        properties: dict | None = None,
+    ) -> None:
+        self.rels.append((from_spec, rel_type, to_spec, properties))
+
+    def fetch_all(
+        self, query: str, params: dict | None = None
+    ) -> list[dict[str, object]]:
+        return []
+
+    def flush_all(self) -> None:
+        return
+
+    def record_pending_call(self, pending: dict[str, object]) -> None:
+        self.pending.append(pending)
+
+    def get_pending_calls(self) -> list[dict[str, object]]:
+        return self.pending
+
+    def replace_pending_calls(self, pending_calls: list[dict[str, object]]) -> None:
+        self.pending = pending_calls
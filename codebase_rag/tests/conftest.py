@@ -1,28 +1,67 @@
 import os
 import shutil
 import sys
-import tempfile
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
+from codebase_rag import graph_cache
 from codebase_rag.graph_updater import GraphUpdater
 from codebase_rag.parser_loader import load_parsers
 from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.tests._ingestor import CaptureIngestor
+
+
+@pytest.fixture(autouse=True)
+def disable_incremental_updates(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep a developer's CODE_GRAPH_RAG_INCREMENTAL from replaying cached graphs.
+
+    A replay leaves ``ast_cache`` empty, and entries from earlier sessions would
+    match since fingerprints ignore absolute paths. Tests that cover the cache
+    enable it explicitly.
+    """
+    monkeypatch.delenv(graph_cache.INCREMENTAL_ENV_VAR, raising=False)
 
 
 @pytest.fixture
-def temp_repo() -> Generator[Path, None, None]:
+def temp_repo(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
     """Creates a temporary repository path for a test and cleans up afterward."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
+    temp_dir = tmp_path_factory.mktemp("repo")
+    yield temp_dir
     shutil.rmtree(temp_dir)
 
 
+@pytest.fixture(scope="session")
+def parsers_and_queries() -> tuple[dict[str, Any], dict[str, Any]]:
+    """Loads Tree-sitter parsers and compiles their queries once per session.
+
+    Under pytest-xdist this runs once per worker. Parser, Language and Query
+    objects are native handles that cannot be pickled, so there is no way to
+    share a compiled set across worker processes.
+    """
+    try:
+        return load_parsers()
+    except RuntimeError as exc:
+        pytest.skip(str(exc))
+
+
+@pytest.fixture(scope="session")
+def java_parsers(
+    parsers_and_queries: tuple[dict[str, Any], dict[str, Any]],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Provides the session parsers, skipping when Java is unavailable."""
+    parsers, _ = parsers_and_queries
+    if "java" not in parsers:
+        pytest.skip("Java parser not available in this environment")
+
+    return parsers_and_queries
+
+
 @pytest.fixture
 def mock_ingestor() -> MagicMock:
     """Provides a mocked MemgraphIngestor instance."""
@@ -32,9 +71,19 @@ def mock_ingestor() -> MagicMock:
 
 
 @pytest.fixture
-def mock_updater(temp_repo: Path, mock_ingestor: MagicMock) -> MagicMock:
+def capture_ingestor() -> CaptureIngestor:
+    """Provides a lightweight ingestor that only records emitted nodes and edges."""
+    return CaptureIngestor()
+
+
+@pytest.fixture
+def mock_updater(
+    temp_repo: Path,
+    mock_ingestor: MagicMock,
+    parsers_and_queries: tuple[dict[str, Any], dict[str, Any]],
+) -> MagicMock:
     """Provides a mocked GraphUpdater instance with necessary dependencies."""
-    parsers, queries = load_parsers()
+    parsers, queries = parsers_and_queries
     mock = MagicMock(spec=GraphUpdater)
     mock.repo_path = temp_repo
     mock.ingestor = mock_ingestor
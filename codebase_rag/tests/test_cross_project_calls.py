@@ -1,442 +1,391 @@
 from __future__ import annotations
 
-import textwrap
+import copy
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from codebase_rag.graph_updater import FunctionRegistryTrie, GraphUpdater
-from codebase_rag.parser_loader import load_parsers
 from codebase_rag.parsers.call_processor import CallProcessor
+from codebase_rag.tests._ingestor import (
+    InMemoryIngestor,
+    Relationship,
+    RelationshipFilter,
+)
 
+JavaParsers = tuple[dict[str, Any], dict[str, Any]]
+GraphSnapshot = tuple[list[tuple[str, dict[str, object]]], list[Relationship]]
 
-class InMemoryIngestor:
-    """Minimal MemgraphIngestor replacement for integration-style tests."""
-
-    def __init__(self) -> None:
-        self.nodes: list[tuple[str, dict[str, object]]] = []
-        self.relationships: list[tuple[tuple[str, str, str], str, tuple[str, str, str], dict | None]] = []
-        self.pending_calls: list[dict[str, object]] = []
-        self.fetch_queries: list[tuple[str, dict[str, object] | None]] = []
-
-    def ensure_node_batch(self, label: str, properties: dict[str, object]) -> None:
-        self.nodes.append((label, properties))
-
-    def ensure_relationship_batch(
-        self,
-        from_spec: tuple[str, str, str],
-        rel_type: str,
-        to_spec: tuple[str, str, str],
-        properties: dict | None = None,
-    ) -> None:
-        self.relationships.append((from_spec, rel_type, to_spec, properties))
-
-    def flush_all(self) -> None:  # pragma: no cover - no-op for tests
-        return
-
-    def fetch_all(self, query: str, params: dict | None = None) -> list[dict[str, object]]:
-        self.fetch_queries.append((query, params))
-        allowed = set(params.get("allowed_labels", [])) if params else set()
-        results: list[dict[str, object]] = []
-
-        qualified_names: set[str] | None = None
-        suffixes: set[str] | None = None
-
-        if params:
-            if "qualified_name" in params and isinstance(params["qualified_name"], str):
-                qualified_names = {params["qualified_name"]}
-            elif "qualified_names" in params and isinstance(
-                params["qualified_names"], (list, tuple, set)
-            ):
-                qualified_names = {
-                    name for name in params["qualified_names"] if isinstance(name, str)
-                }
-
-            if "suffix" in params and isinstance(params["suffix"], str):
-                suffixes = {params["suffix"]}
-            elif "suffixes" in params and isinstance(
-                params["suffixes"], (list, tuple, set)
-            ):
-                suffixes = {
-                    suffix for suffix in params["suffixes"] if isinstance(suffix, str)
-                }
-
-        for label, props in self.nodes:
-            if allowed and label not in allowed:
-                continue
-            qualified_name = props.get("qualified_name")
-            if not isinstance(qualified_name, str):
-                continue
-            if qualified_names is not None and qualified_name not in qualified_names:
-                continue
-            if suffixes is not None and not any(
-                qualified_name.endswith(suffix) for suffix in suffixes
-            ):
-                continue
-            results.append({"qualified_name": qualified_name, "labels": [label]})
-        return results
-
-    def execute_write(self, query: str, params: dict | None = None) -> None:  # pragma: no cover - unused
-        return
-
-    def record_pending_call(self, pending: dict[str, object]) -> None:
-        if pending not in self.pending_calls:
-            self.pending_calls.append(pending)
-
-    def get_pending_calls(self) -> list[dict[str, object]]:
-        return list(self.pending_calls)
-
-    def replace_pending_calls(self, pending_calls: list[dict[str, object]]) -> None:
-        self.pending_calls = list(pending_calls)
-
-
-class DummyImportProcessor:
-    """Simple stand-in for ImportProcessor used in call processor unit tests."""
-
-    def __init__(self) -> None:
-        self.import_mapping: dict[str, dict[str, str]] = {}
+LIBRARY_PROJECT = "library"
 
+LIBRARY_CLASS_JAVA = b"""\
+package com.example.lib;
 
-class DummyTypeInference:
-    """Simple type inference stub that returns empty maps."""
-
-    def build_local_variable_type_map(
-        self, caller_node, module_qn: str, language: str
-    ) -> dict[str, str]:  # pragma: no cover - trivial stub
-        return {}
+public class LibraryClass {
+    public static String greet() {
+        return "hello";
+    }
+}
+"""
 
+APP_JAVA = b"""\
+package com.example.app;
 
-def make_call_processor(ingestor: InMemoryIngestor) -> CallProcessor:
-    """Create a CallProcessor configured for unit tests."""
-
-    function_registry = FunctionRegistryTrie()
-    function_registry[
-        "consumer.src.main.java.com.microsoft.app.App.App.run"
-    ] = "Method"
-    return CallProcessor(
-        ingestor=ingestor,
-        repo_path=Path("."),
-        project_name="consumer",
-        function_registry=function_registry,
-        import_processor=DummyImportProcessor(),
-        type_inference=DummyTypeInference(),
-        class_inheritance={},
-    )
+import com.example.lib.LibraryClass;
 
+public class App {
+    public String run() {
+        return LibraryClass.greet();
+    }
+}
+"""
 
-def load_java_parsers_or_skip():
-    """Load Java parsers or skip tests when unavailable."""
+TELEMETRY_APP_JAVA = b"""\
+package com.microsoft.app;
 
-    try:
-        parsers, queries = load_parsers()
-    except RuntimeError as exc:
-        pytest.skip(str(exc))
+import com.microsoft.telemetry.TelemetryProvider;
 
-    if "java" not in parsers:
-        pytest.skip("Java parser not available in this environment")
+public class App {
+    private final TelemetryProvider telemetryProvider;
 
-    return parsers, queries
+    public App(TelemetryProvider telemetryProvider) {
+        this.telemetryProvider = telemetryProvider;
+    }
 
+    public void run() {
+        telemetryProvider.resolveCoordinate(null, 1, 2);
+    }
+}
+"""
 
-def test_cross_project_calls_create_edges(temp_repo: Path) -> None:
-    """Cross-project method calls should resolve to definitions from other projects."""
+TELEMETRY_PROVIDER_JAVA = b"""\
+package com.microsoft.telemetry;
 
-    parsers, queries = load_java_parsers_or_skip()
-    ingestor = InMemoryIngestor()
+import com.microsoft.telemetry.dto.LocationDTO;
 
-    library_project = temp_repo / "library"
-    library_src = library_project / "src/main/java/com/example/lib"
-    library_src.mkdir(parents=True, exist_ok=True)
-    (library_src / "LibraryClass.java").write_text(
-        textwrap.dedent(
-            """
-            package com.example.lib;
-
-            public class LibraryClass {
-                public static String greet() {
-                    return "hello";
-                }
-            }
-            """
-        ).strip()
-    )
+public interface TelemetryProvider {
+    LocationDTO resolveCoordinate(
+        LocationDTO locationDTO,
+        int observerSiteId,
+        int observerUnitId
+    );
+}
+"""
 
-    library_updater = GraphUpdater(ingestor, library_project, parsers, queries)
-    library_updater.run()
-
-    consumer_project = temp_repo / "consumer"
-    consumer_src = consumer_project / "src/main/java/com/microsoft/app"
-    consumer_src.mkdir(parents=True, exist_ok=True)
-    (consumer_src / "App.java").write_text(
-        textwrap.dedent(
-            """
-            package com.example.app;
-
-            import com.example.lib.LibraryClass;
-
-            public class App {
-                public String run() {
-                    return LibraryClass.greet();
-                }
-            }
-            """
-        ).strip()
-    )
+LOCATION_DTO_JAVA = b"""\
+package com.microsoft.telemetry.dto;
 
-    consumer_updater = GraphUpdater(ingestor, consumer_project, parsers, queries)
-    consumer_updater.run()
+public record LocationDTO(double lat, double lon) {}
+"""
 
-    expected_caller = (
-        "Method",
-        "qualified_name",
-        f"{consumer_project.name}.src.main.java.com.example.app.App.App.run",
-    )
+FJORD_APP_JAVA = b"""\
+package com.microsoft.app;
 
-    call_relationships = [
-        rel for rel in ingestor.relationships if rel[1] == "CALLS"
-    ]
+import io.fjord.telemetry.TelemetryProvider;
 
-    assert any(
-        rel[0] == expected_caller and rel[2][0] == "Method"
-        and rel[2][2].startswith(
-            f"{library_project.name}.src.main.java.com.example.lib.LibraryClass.LibraryClass.greet"
-        )
-        for rel in call_relationships
-    ), "Expected CALLS relationship between consumer run() and library greet()"
+public class App {
+    private final TelemetryProvider telemetryProvider;
 
-def test_cross_project_calls_resolve_after_dependency(temp_repo: Path) -> None:
-    """Cross-project calls should be created even if dependency is ingested later."""
+    public App(TelemetryProvider telemetryProvider) {
+        this.telemetryProvider = telemetryProvider;
+    }
 
-    parsers, queries = load_java_parsers_or_skip()
+    public void run() {
+        telemetryProvider.resolveCoordinate(null, 1, 2);
+    }
+}
+"""
 
-    ingestor = InMemoryIngestor()
+FJORD_TELEMETRY_PROVIDER_JAVA = b"""\
+package io.fjord.telemetry;
 
-    consumer_project = temp_repo / "consumer"
-    consumer_src = consumer_project / "src/main/java/com/microsoft/app"
-    consumer_src.mkdir(parents=True, exist_ok=True)
-    (consumer_src / "App.java").write_text(
-        textwrap.dedent(
-            """
-            package com.microsoft.app;
-
-            import com.microsoft.telemetry.TelemetryProvider;
-
-            public class App {
-                private final TelemetryProvider telemetryProvider;
-
-                public App(TelemetryProvider telemetryProvider) {
-                    this.telemetryProvider = telemetryProvider;
-                }
-
-                public void run() {
-                    telemetryProvider.resolveCoordinate(null, 1, 2);
-                }
-            }
-            """
-        ).strip()
-    )
+import io.fjord.telemetry.dto.LocationDTO;
 
-    consumer_updater = GraphUpdater(ingestor, consumer_project, parsers, queries)
-    consumer_updater.run()
-
-    library_project = temp_repo / "microsoft-telemetry"
-    library_src = library_project / "src/main/java/com/microsoft/telemetry"
-    library_src.mkdir(parents=True, exist_ok=True)
-    (library_src / "TelemetryProvider.java").write_text(
-        textwrap.dedent(
-            """
-            package com.microsoft.telemetry;
-
-            import com.microsoft.telemetry.dto.LocationDTO;
-
-            public interface TelemetryProvider {
-                LocationDTO resolveCoordinate(
-                    LocationDTO locationDTO,
-                    int observerSiteId,
-                    int observerUnitId
-                );
-            }
-            """
-        ).strip()
-    )
+public interface TelemetryProvider {
+    LocationDTO resolveCoordinate(
+        LocationDTO locationDTO,
+        int observerSiteId,
+        int observerUnitId
+    );
+}
+"""
 
-    dto_src = library_project / "src/main/java/com/microsoft/telemetry/dto"
-    dto_src.mkdir(parents=True, exist_ok=True)
-    (dto_src / "LocationDTO.java").write_text(
-        textwrap.dedent(
-            """
-            package com.microsoft.telemetry.dto;
+FQ_APP_JAVA = b"""\
+package com.example.app;
 
-            public record LocationDTO(double lat, double lon) {}
-            """
-        ).strip()
-    )
+public class App {
+    public String run() {
+        return com.example.lib.LibraryClass.greet();
+    }
+}
+"""
 
-    library_updater = GraphUpdater(ingestor, library_project, parsers, queries)
-    library_updater.run()
+TELEMETRY_PROVIDER_STUB_JAVA = b"""\
+package com.microsoft.telemetry;
 
-    expected_caller = (
-        "Method",
-        "qualified_name",
-        f"{consumer_project.name}.src.main.java.com.microsoft.app.App.App.run",
-    )
+public interface TelemetryProvider {
+    void resolveCoordinate();
+}
+"""
 
-    telemetry_interface_suffix = (
-        "microsoft.telemetry.TelemetryProvider.TelemetryProvider.resolveCoordinate"
-    )
 
-    call_relationships = [
-        rel for rel in ingestor.relationships if rel[1] == "CALLS"
-    ]
+class DummyImportProcessor:
+    """Simple stand-in for ImportProcessor used in call processor unit tests."""
 
-    assert any(
-        rel[0] == expected_caller
-        and rel[2][0] == "Method"
-        and telemetry_interface_suffix in rel[2][2]
-        for rel in call_relationships
-    ), "Expected CALLS relationship after dependency ingestion"
+    def __init__(self) -> None:
+        self.import_mapping: dict[str, dict[str, str]] = {}
 
 
-def test_cross_project_calls_ignore_third_party(temp_repo: Path) -> None:
-    """Cross-project Java calls should be ignored for non-first-party packages."""
+class DummyTypeInference:
+    """Simple type inference stub that returns empty maps."""
 
-    parsers, queries = load_java_parsers_or_skip()
+    def build_local_variable_type_map(
+        self, caller_node, module_qn: str, language: str
+    ) -> dict[str, str]:  # pragma: no cover - trivial stub
+        return {}
 
-    ingestor = InMemoryIngestor()
 
-    consumer_project = temp_repo / "consumer"
-    consumer_src = consumer_project / "src/main/java/com/microsoft/app"
-    consumer_src.mkdir(parents=True, exist_ok=True)
-    (consumer_src / "App.java").write_text(
-        textwrap.dedent(
-            """
-            package com.microsoft.app;
-
-            import io.fjord.telemetry.TelemetryProvider;
-
-            public class App {
-                private final TelemetryProvider telemetryProvider;
-
-                public App(TelemetryProvider telemetryProvider) {
-                    this.telemetryProvider = telemetryProvider;
-                }
-
-                public void run() {
-                    telemetryProvider.resolveCoordinate(null, 1, 2);
-                }
-            }
-            """
-        ).strip()
-    )
+def make_call_processor(ingestor: InMemoryIngestor) -> CallProcessor:
+    """Create a CallProcessor configured for unit tests."""
 
-    GraphUpdater(ingestor, consumer_project, parsers, queries).run()
-
-    library_project = temp_repo / "fjord-telemetry-adapter"
-    library_src = library_project / "src/main/java/io/fjord/telemetry"
-    library_src.mkdir(parents=True, exist_ok=True)
-    (library_src / "TelemetryProvider.java").write_text(
-        textwrap.dedent(
-            """
-            package io.fjord.telemetry;
-
-            import io.fjord.telemetry.dto.LocationDTO;
-
-            public interface TelemetryProvider {
-                LocationDTO resolveCoordinate(
-                    LocationDTO locationDTO,
-                    int observerSiteId,
-                    int observerUnitId
-                );
-            }
-            """
-        ).strip()
+    function_registry = FunctionRegistryTrie()
+    function_registry.bulk_insert(
+        [("consumer.src.main.java.com.microsoft.app.App.App.run", "Method")]
     )
-
-    GraphUpdater(ingestor, library_project, parsers, queries).run()
-
-    expected_caller = (
-        "Method",
-        "qualified_name",
-        f"{consumer_project.name}.src.main.java.com.microsoft.app.App.App.run",
+    return CallProcessor(
+        ingestor=ingestor,
+        repo_path=Path("."),
+        project_name="consumer",
+        function_registry=function_registry,
+        import_processor=DummyImportProcessor(),
+        type_inference=DummyTypeInference(),
+        class_inheritance={},
     )
 
-    call_relationships = [
-        rel for rel in ingestor.relationships if rel[1] == "CALLS"
-    ]
-
-    assert not any(
-        rel[0] == expected_caller and rel[2][0] == "Method"
-        for rel in call_relationships
-    ), "Did not expect CALLS relationship for third-party package"
-
-
-def test_cross_project_calls_with_fully_qualified_name(temp_repo: Path) -> None:
-    """Calls using fully qualified class names should resolve across projects."""
 
-    parsers, queries = load_java_parsers_or_skip()
+@pytest.fixture(scope="session")
+def library_graph(
+    tmp_path_factory: pytest.TempPathFactory, java_parsers: JavaParsers
+) -> GraphSnapshot:
+    """Parse the shared LibraryClass project once and snapshot its graph."""
 
+    parsers, queries = java_parsers
     ingestor = InMemoryIngestor()
 
-    library_project = temp_repo / "fq-library"
-    library_src = library_project / "src/main/java/com/example/lib"
-    library_src.mkdir(parents=True, exist_ok=True)
-    (library_src / "LibraryClass.java").write_text(
-        textwrap.dedent(
-            """
-            package com.example.lib;
-
-            public class LibraryClass {
-                public static String greet() {
-                    return "hello";
-                }
-            }
-            """
-        ).strip()
+    library_project = tmp_path_factory.mktemp("library-graph") / LIBRARY_PROJECT
+    write_source(
+        library_project,
+        "src/main/java/com/example/lib/LibraryClass.java",
+        LIBRARY_CLASS_JAVA,
     )
 
     GraphUpdater(ingestor, library_project, parsers, queries).run()
+    return list(ingestor.nodes), list(ingestor.relationships)
 
-    consumer_project = temp_repo / "fq-consumer"
-    consumer_src = consumer_project / "src/main/java/com/example/app"
-    consumer_src.mkdir(parents=True, exist_ok=True)
-    (consumer_src / "App.java").write_text(
-        textwrap.dedent(
-            """
-            package com.example.app;
-
-            public class App {
-                public String run() {
-                    return com.example.lib.LibraryClass.greet();
-                }
-            }
-            """
-        ).strip()
-    )
 
-    GraphUpdater(ingestor, consumer_project, parsers, queries).run()
+def write_source(project_path: Path, relative_path: str, source: bytes) -> None:
+    """Write ``source`` below ``project_path``, creating parent directories."""
 
-    expected_caller = (
-        "Method",
-        "qualified_name",
-        f"{consumer_project.name}.src.main.java.com.example.app.App.App.run",
-    )
+    file_path = project_path / relative_path
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(source)
 
-    call_relationships = [
-        rel for rel in ingestor.relationships if rel[1] == "CALLS"
-    ]
 
-    assert any(
-        rel[0] == expected_caller
-        and rel[2][0] == "Method"
-        and rel[2][2].startswith(
-            f"{library_project.name}.src.main.java.com.example.lib.LibraryClass.LibraryClass.greet"
-        )
-        for rel in call_relationships
-    ), "Expected CALLS relationship for fully qualified cross-project call"
+def seed_ingestor(
+    snapshot: GraphSnapshot, relationship_filter: RelationshipFilter | None = None
+) -> InMemoryIngestor:
+    """Create an ingestor pre-populated with a private copy of a graph snapshot."""
+
+    nodes, relationships = copy.deepcopy(snapshot)
+    ingestor = InMemoryIngestor(relationship_filter)
+    ingestor.ensure_nodes_batch(nodes)
+    ingestor.ensure_relationships_batch(relationships)
+    return ingestor
+
+
+def only_calls(
+    from_spec: tuple[str, str, str], rel_type: str, to_spec: tuple[str, str, str]
+) -> bool:
+    """Relationship filter keeping just the CALLS edges the case assertions read."""
+
+    return rel_type == "CALLS"
+
+
+def calls_from(
+    ingestor: InMemoryIngestor, caller: tuple[str, str, str]
+) -> set[tuple[str, str]]:
+    """Return the (label, qualified_name) of every CALLS target of ``caller``."""
+
+    label, key, qualified_name = caller
+    assert key == "qualified_name"
+    return set(ingestor.find_calls_from(qualified_name, label))
+
+
+CaseAssertion = Callable[[InMemoryIngestor], None]
+
+
+def expect_call(
+    caller: str, callee: str, message: str, *, substring: bool = False
+) -> CaseAssertion:
+    """Check that method ``caller`` CALLS a method qualified under ``callee``.
+
+    ``callee`` is matched as a prefix, or anywhere in the callee's qualified
+    name when ``substring`` is set.
+    """
+
+    def matches(qualified_name: str) -> bool:
+        if substring:
+            return callee in qualified_name
+        return qualified_name.startswith(callee)
+
+    def check(ingestor: InMemoryIngestor) -> None:
+        callees = calls_from(ingestor, ("Method", "qualified_name", caller))
+        assert any(
+            label == "Method" and matches(qualified_name)
+            for label, qualified_name in callees
+        ), message
+
+    return check
+
+
+def expect_no_call(caller: str, message: str) -> CaseAssertion:
+    """Check that method ``caller`` CALLS no method at all."""
+
+    def check(ingestor: InMemoryIngestor) -> None:
+        callees = calls_from(ingestor, ("Method", "qualified_name", caller))
+        assert "Method" not in {label for label, _ in callees}, message
+
+    return check
+
+
+@dataclass(frozen=True)
+class CrossProjectCase:
+    """Java projects to ingest, in order, and the check to run on the graph."""
+
+    name: str
+    # (project name, {relative path: source}) pairs in ingestion order.
+    projects: tuple[tuple[str, dict[str, bytes]], ...]
+    assertion: CaseAssertion
+    # Start from a copy of the session-wide ``library_graph`` snapshot.
+    seed_library: bool = False
+
+
+CROSS_PROJECT_CASES = [
+    CrossProjectCase(
+        name="first_party",
+        projects=(("consumer", {"src/main/java/com/example/app/App.java": APP_JAVA}),),
+        seed_library=True,
+        assertion=expect_call(
+            "consumer.src.main.java.com.example.app.App.App.run",
+            f"{LIBRARY_PROJECT}.src.main.java.com.example.lib.LibraryClass"
+            ".LibraryClass.greet",
+            "Expected CALLS relationship between consumer run() and library greet()",
+        ),
+    ),
+    CrossProjectCase(
+        name="resolve_after_dependency",
+        projects=(
+            (
+                "consumer",
+                {"src/main/java/com/microsoft/app/App.java": TELEMETRY_APP_JAVA},
+            ),
+            (
+                "microsoft-telemetry",
+                {
+                    "src/main/java/com/microsoft/telemetry/TelemetryProvider.java": TELEMETRY_PROVIDER_JAVA,
+                    "src/main/java/com/microsoft/telemetry/dto/LocationDTO.java": LOCATION_DTO_JAVA,
+                },
+            ),
+        ),
+        assertion=expect_call(
+            "consumer.src.main.java.com.microsoft.app.App.App.run",
+            "microsoft.telemetry.TelemetryProvider.TelemetryProvider.resolveCoordinate",
+            "Expected CALLS relationship after dependency ingestion",
+            substring=True,
+        ),
+    ),
+    CrossProjectCase(
+        name="third_party_ignored",
+        projects=(
+            ("consumer", {"src/main/java/com/microsoft/app/App.java": FJORD_APP_JAVA}),
+            (
+                "fjord-telemetry-adapter",
+                {
+                    "src/main/java/io/fjord/telemetry/TelemetryProvider.java": FJORD_TELEMETRY_PROVIDER_JAVA,
+                },
+            ),
+        ),
+        assertion=expect_no_call(
+            "consumer.src.main.java.com.microsoft.app.App.App.run",
+            "Did not expect CALLS relationship for third-party package",
+        ),
+    ),
+    CrossProjectCase(
+        name="fq_name",
+        projects=(
+            ("fq-consumer", {"src/main/java/com/example/app/App.java": FQ_APP_JAVA}),
+        ),
+        seed_library=True,
+        assertion=expect_call(
+            "fq-consumer.src.main.java.com.example.app.App.App.run",
+            f"{LIBRARY_PROJECT}.src.main.java.com.example.lib.LibraryClass"
+            ".LibraryClass.greet",
+            "Expected CALLS relationship for fully qualified cross-project call",
+        ),
+    ),
+]
+
+
+@pytest.fixture(scope="session")
+def java_cross_project_graph(
+    tmp_path_factory: pytest.TempPathFactory,
+    java_parsers: JavaParsers,
+    library_graph: GraphSnapshot,
+) -> dict[str, InMemoryIngestor]:
+    """Build every cross-project case once per session, keyed by case name.
+
+    All sources are written below one shared workspace, but each case keeps
+    its own ingestor: the consumers reuse project and package names, so a
+    single graph would let one case's definitions satisfy another's calls.
+    The projects within a case run in order because later ones resolve
+    against earlier ones.
+    """
+
+    parsers, queries = java_parsers
+    workspace = tmp_path_factory.mktemp("cross-project")
+    graphs: dict[str, InMemoryIngestor] = {}
+
+    for case in CROSS_PROJECT_CASES:
+        if case.seed_library:
+            ingestor = seed_ingestor(library_graph, only_calls)
+        else:
+            ingestor = InMemoryIngestor(only_calls)
+
+        for project_name, files in case.projects:
+            project_path = workspace / case.name / project_name
+            for relative_path, source in files.items():
+                write_source(project_path, relative_path, source)
+            GraphUpdater(ingestor, project_path, parsers, queries).run()
+
+        graphs[case.name] = ingestor
+    return graphs
+
+
+@pytest.mark.parametrize("case", CROSS_PROJECT_CASES, ids=lambda case: case.name)
+def test_cross_project_call_variants(
+    java_cross_project_graph: dict[str, InMemoryIngestor],
+    case: CrossProjectCase,
+) -> None:
+    """Cross-project Java calls resolve to first-party definitions in other projects."""
+
+    case.assertion(java_cross_project_graph[case.name])
 
 
 def test_cross_project_lookup_batches_queries(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Exact and suffix lookups should batch candidates into a single DB call each."""
+    """Exact and suffix lookups should batch candidates into a single DB call."""
 
     ingestor = InMemoryIngestor()
     target_qn = (
@@ -468,16 +417,15 @@ def test_cross_project_lookup_batches_queries(monkeypatch: pytest.MonkeyPatch) -
     )
 
     assert resolved == ("Method", target_qn)
-    assert len(ingestor.fetch_queries) == 2
-    _, first_params = ingestor.fetch_queries[0]
-    assert "qualified_name" not in first_params
-    assert sorted(first_params["qualified_names"]) == sorted(candidates)
-    _, second_params = ingestor.fetch_queries[1]
-    expected_suffixes = {
+    assert len(ingestor.fetch_queries) == 1
+    _, params = ingestor.fetch_queries[0]
+    assert "qualified_name" not in params
+    assert params["qualified_names"] == frozenset(candidates)
+    expected_suffixes = frozenset(
         f".{candidate}" if not candidate.startswith(".") else candidate
         for candidate in candidates
-    }
-    assert set(second_params["suffixes"]) == expected_suffixes
+    )
+    assert params["suffixes"] == expected_suffixes
 
 
 def test_cross_project_lookup_skips_mismatched_prefixes(
@@ -505,26 +453,37 @@ def test_cross_project_lookup_skips_mismatched_prefixes(
     assert ingestor.fetch_queries == []
 
 
-def test_pending_cross_project_skips_unparsed_callers(temp_repo: Path) -> None:
+def test_cross_project_candidates_are_memoized() -> None:
+    """Candidate generation is cached per imported name and returns fresh lists."""
+
+    call_processor = make_call_processor(InMemoryIngestor())
+    imported_qn = "com.microsoft.lib.LibraryClass.greet()"
+
+    first = call_processor._generate_cross_project_candidates(imported_qn)  # pylint: disable=protected-access
+    first.append("mutated")
+    second = call_processor._generate_cross_project_candidates(imported_qn)  # pylint: disable=protected-access
+
+    assert sorted(second) == [
+        "com.microsoft.lib.LibraryClass.LibraryClass.greet",
+        "com.microsoft.lib.LibraryClass.greet",
+    ]
+    assert imported_qn in call_processor._cross_project_candidate_cache  # pylint: disable=protected-access
+
+
+def test_pending_cross_project_skips_unparsed_callers(
+    temp_repo: Path, java_parsers: JavaParsers
+) -> None:
     """Pending cross-project calls are ignored when the caller was not parsed."""
 
-    parsers, queries = load_java_parsers_or_skip()
+    parsers, queries = java_parsers
 
     ingestor = InMemoryIngestor()
 
     library_project = temp_repo / "telemetry-lib"
-    library_src = library_project / "src/main/java/com/microsoft/telemetry"
-    library_src.mkdir(parents=True, exist_ok=True)
-    (library_src / "TelemetryProvider.java").write_text(
-        textwrap.dedent(
-            """
-            package com.microsoft.telemetry;
-
-            public interface TelemetryProvider {
-                void resolveCoordinate();
-            }
-            """
-        ).strip()
+    write_source(
+        library_project,
+        "src/main/java/com/microsoft/telemetry/TelemetryProvider.java",
+        TELEMETRY_PROVIDER_STUB_JAVA,
     )
 
     ingestor.record_pending_call(
@@ -550,10 +509,5 @@ def test_pending_cross_project_skips_unparsed_callers(temp_repo: Path) -> None:
         "consumer.src.main.java.com.microsoft.app.App.App.run",
     )
 
-    call_relationships = [
-        rel for rel in ingestor.relationships if rel[1] == "CALLS"
-    ]
-
-    assert not any(rel[0] == expected_caller for rel in call_relationships)
+    assert not calls_from(ingestor, expected_caller)
     assert ingestor.pending_calls and ingestor.pending_calls[0]["caller_was_parsed"] is False
-
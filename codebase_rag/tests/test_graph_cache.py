@@ -0,0 +1,122 @@
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from codebase_rag import graph_cache
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.tests._ingestor import InMemoryIngestor
+
+
+@pytest.fixture
+def graph_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable incremental mode with a private cache directory."""
+    cache_dir = tmp_path / "graph-cache"
+    monkeypatch.setenv(graph_cache.INCREMENTAL_ENV_VAR, "1")
+    monkeypatch.setattr(graph_cache, "CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+def _write_project(temp_repo: Path) -> Path:
+    project_path = temp_repo / "cached_project"
+    project_path.mkdir()
+    (project_path / "utils.py").write_text("def helper():\n    return 1\n")
+    (project_path / "main.py").write_text(
+        "from utils import helper\n\n\ndef run():\n    return helper()\n"
+    )
+    return project_path
+
+
+def test_fingerprint_tracks_content_and_context(temp_repo: Path) -> None:
+    """Fingerprints change with file contents and with the extra context."""
+    project_path = _write_project(temp_repo)
+
+    baseline = graph_cache.compute_project_fingerprint(project_path)
+    assert graph_cache.compute_project_fingerprint(project_path) == baseline
+    assert (
+        graph_cache.compute_project_fingerprint(
+            project_path, context=["lib.f:Function"]
+        )
+        != baseline
+    )
+
+    (project_path / "utils.py").write_text("def helper():\n    return 2\n")
+    assert graph_cache.compute_project_fingerprint(project_path) != baseline
+
+
+def test_rerun_replays_cached_graph(
+    temp_repo: Path,
+    graph_cache_dir: Path,
+    parsers_and_queries: tuple[dict[str, Any], dict[str, Any]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A second run over identical sources replays the graph without parsing."""
+    parsers, queries = parsers_and_queries
+    project_path = _write_project(temp_repo)
+
+    first = InMemoryIngestor()
+    GraphUpdater(first, project_path, parsers, queries).run()
+    assert list(graph_cache_dir.glob("*.pickle"))
+
+    def fail_processing(self: GraphUpdater) -> None:
+        raise AssertionError("cached run should not parse files")
+
+    monkeypatch.setattr(GraphUpdater, "_process_files", fail_processing)
+
+    second = InMemoryIngestor()
+    updater = GraphUpdater(second, project_path, parsers, queries)
+    updater.run()
+
+    assert list(second.nodes) == list(first.nodes)
+    assert list(second.relationships) == list(first.relationships)
+    assert "cached_project.main.run" in updater.function_registry
+
+
+def test_explicit_opt_out_overrides_environment(
+    temp_repo: Path,
+    graph_cache_dir: Path,
+    parsers_and_queries: tuple[dict[str, Any], dict[str, Any]],
+) -> None:
+    """incremental=False keeps the real ingestor and writes no cache entry."""
+    parsers, queries = parsers_and_queries
+    project_path = _write_project(temp_repo)
+    ingestor = InMemoryIngestor()
+
+    updater = GraphUpdater(ingestor, project_path, parsers, queries, incremental=False)
+    updater.run()
+
+    assert updater.ingestor is ingestor
+    assert not graph_cache_dir.exists()
+
+
+def test_fingerprint_tracks_tool_versions(
+    temp_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Upgrading the parser or a grammar changes every fingerprint."""
+    project_path = _write_project(temp_repo)
+    baseline = graph_cache.compute_project_fingerprint(project_path)
+
+    monkeypatch.setattr(graph_cache, "tool_versions", lambda: "tree-sitter==99.0")
+
+    assert graph_cache.compute_project_fingerprint(project_path) != baseline
+
+
+def test_store_evicts_least_recently_used_entries(
+    graph_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Only the MAX_CACHE_ENTRIES most recently used graphs are kept."""
+    monkeypatch.setattr(graph_cache, "MAX_CACHE_ENTRIES", 2)
+    recorder = graph_cache.RecordingIngestor(InMemoryIngestor())
+
+    for index, fingerprint in enumerate(("reused", "stale")):
+        graph_cache.store_cached_graph(fingerprint, recorder)
+        os.utime(graph_cache_dir / f"{fingerprint}.pickle", (index, index))
+
+    assert graph_cache.load_cached_graph("reused") is not None
+    graph_cache.store_cached_graph("fresh", recorder)
+
+    assert sorted(path.stem for path in graph_cache_dir.glob("*.pickle")) == [
+        "fresh",
+        "reused",
+    ]
@@ -0,0 +1,83 @@
+from codebase_rag.tests._ingestor import InMemoryIngestor
+
+
+def test_fetch_all_filters_by_qualified_name_prefix() -> None:
+    """A qualified_name_prefix param bounds fetch_all to one sorted range."""
+
+    ingestor = InMemoryIngestor()
+    ingestor.ensure_nodes_batch(
+        ("Method", {"qualified_name": qualified_name})
+        for qualified_name in (
+            "library.lib.B.run",
+            "library.lib.A.run",
+            "library.libx.C.run",
+            "consumer.app.App.run",
+        )
+    )
+    ingestor.ensure_node_batch("Class", {"qualified_name": "library.lib.A"})
+
+    rows = ingestor.fetch_all(
+        "MATCH (n) RETURN n",
+        {"allowed_labels": ["Method"], "qualified_name_prefix": "library.lib."},
+    )
+
+    assert [row["qualified_name"] for row in rows] == [
+        "library.lib.A.run",
+        "library.lib.B.run",
+    ]
+
+
+def test_fetch_all_returns_exact_matches_in_sorted_order() -> None:
+    """Exact-match batches come back sorted, independent of the hash seed."""
+
+    ingestor = InMemoryIngestor()
+    qualified_names = [f"library.lib.C{index}.run" for index in range(20)]
+    ingestor.ensure_nodes_batch(
+        ("Method", {"qualified_name": qualified_name})
+        for qualified_name in qualified_names
+    )
+
+    rows = ingestor.fetch_all(
+        "MATCH (n) RETURN n", {"qualified_names": list(reversed(qualified_names))}
+    )
+
+    assert [row["qualified_name"] for row in rows] == sorted(qualified_names)
+
+
+def test_prefix_lookup_sees_nodes_added_after_a_query() -> None:
+    """Ingesting a node invalidates that label's sorted prefix index."""
+
+    ingestor = InMemoryIngestor()
+    ingestor.ensure_node_batch("Method", {"qualified_name": "library.lib.B.run"})
+    assert list(ingestor.iter_qualified_names_with_prefix("Method", "library.")) == [
+        "library.lib.B.run"
+    ]
+
+    ingestor.ensure_node_batch("Method", {"qualified_name": "library.lib.A.run"})
+
+    assert list(ingestor.iter_qualified_names_with_prefix("Method", "library.")) == [
+        "library.lib.A.run",
+        "library.lib.B.run",
+    ]
+
+
+def test_pending_calls_are_deduplicated() -> None:
+    """Re-recording a pending call is a no-op until the pending list is replaced."""
+
+    ingestor = InMemoryIngestor()
+    pending = {
+        "caller_type": "Method",
+        "caller_qn": "consumer.src.main.java.com.microsoft.app.App.App.run",
+        "call_name": "TelemetryProvider.resolveCoordinate",
+        "candidates": ["b.TelemetryProvider.resolveCoordinate", "a.resolveCoordinate"],
+    }
+
+    ingestor.record_pending_call(pending)
+    ingestor.record_pending_call(
+        {**pending, "candidates": list(reversed(pending["candidates"]))}
+    )
+    assert ingestor.get_pending_calls() == [pending]
+
+    ingestor.replace_pending_calls([])
+    ingestor.record_pending_call(pending)
+    assert ingestor.get_pending_calls() == [pending]
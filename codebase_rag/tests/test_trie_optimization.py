@@ -33,6 +33,32 @@ class TestTrieOptimization:
         # Test length
         assert len(trie) == 5
 
+    def test_bulk_insert_matches_individual_inserts(self) -> None:
+        """Test bulk insertion builds the same trie as repeated inserts."""
+        pairs = [
+            ("com.example.models.User.set_name", "FUNCTION"),
+            ("com.example.utils.Logger", "CLASS"),
+            ("com.example.models.User", "CLASS"),
+            ("com.example.utils.Logger.info", "FUNCTION"),
+            ("com.example.models.User.get_name", "FUNCTION"),
+            ("org.other.Helper", "CLASS"),
+            ("com.example.utils.Logger", "INTERFACE"),
+        ]
+
+        expected = FunctionRegistryTrie()
+        for qualified_name, func_type in pairs:
+            expected.insert(qualified_name, func_type)
+
+        trie = FunctionRegistryTrie()
+        trie.bulk_insert(pairs)
+
+        assert trie.root == expected.root
+        assert dict(trie.items()) == dict(expected.items())
+        assert trie.get("com.example.utils.Logger") == "INTERFACE"
+        assert trie.find_with_prefix_and_suffix("com.example", "get_name") == [
+            "com.example.models.User.get_name"
+        ]
+
     def test_trie_prefix_and_suffix_search(self) -> None:
         """Test the optimized prefix+suffix search functionality."""
         trie = FunctionRegistryTrie()
@@ -1,21 +1,10 @@
 from pathlib import Path
-from typing import cast
-from unittest.mock import MagicMock
+from typing import Any
 
 from codebase_rag.graph_updater import GraphUpdater
-from codebase_rag.parser_loader import load_parsers
+from codebase_rag.tests._ingestor import CaptureIngestor
 
-
-def test_vue_single_file_component_scripts(
-    temp_repo: Path, mock_ingestor: MagicMock
-) -> None:
-    """Ensure Vue SFC <script> contents are parsed using JS/TS logic."""
-
-    project_path = temp_repo / "vue_project"
-    project_path.mkdir()
-
-    (project_path / "ComponentJs.vue").write_text(
-        """
+COMPONENT_JS_VUE = b"""\
 <template>
   <div>{{ message }}</div>
 </template>
@@ -34,11 +23,9 @@ export default {
   }
 }
 </script>
-""".strip()
-    )
+"""
 
-    (project_path / "ComponentTs.vue").write_text(
-        """
+COMPONENT_TS_VUE = b"""\
 <template>
   <div>{{ total }}</div>
 </template>
@@ -54,12 +41,25 @@ import { computed } from 'vue'
 
 const total = computed(() => add(2, 3))
 </script>
-""".strip()
-    )
+"""
 
-    parsers, queries = load_parsers()
+
+def test_vue_single_file_component_scripts(
+    temp_repo: Path,
+    capture_ingestor: CaptureIngestor,
+    parsers_and_queries: tuple[dict[str, Any], dict[str, Any]],
+) -> None:
+    """Ensure Vue SFC <script> contents are parsed using JS/TS logic."""
+
+    project_path = temp_repo / "vue_project"
+    project_path.mkdir()
+
+    (project_path / "ComponentJs.vue").write_bytes(COMPONENT_JS_VUE)
+    (project_path / "ComponentTs.vue").write_bytes(COMPONENT_TS_VUE)
+
+    parsers, queries = parsers_and_queries
     updater = GraphUpdater(
-        ingestor=mock_ingestor,
+        ingestor=capture_ingestor,
         repo_path=project_path,
         parsers=parsers,
         queries=queries,
@@ -69,19 +69,14 @@ const total = computed(() => add(2, 3))
 
     project_name = project_path.name
 
-    function_nodes = [
-        call
-        for call in mock_ingestor.ensure_node_batch.call_args_list
-        if call.args and call.args[0] == "Function"
-    ]
-
-    qualified_names = {
-        cast(dict[str, object], call.args[1])["qualified_name"]
-        for call in function_nodes
+    function_qns = {
+        properties.get("qualified_name")
+        for label, properties in capture_ingestor.nodes
+        if label == "Function"
     }
 
-    assert f"{project_name}.ComponentJs.greet" in qualified_names
-    assert f"{project_name}.ComponentTs.add" in qualified_names
+    assert f"{project_name}.ComponentJs.greet" in function_qns
+    assert f"{project_name}.ComponentTs.add" in function_qns
 
     js_root, js_language = updater.ast_cache[project_path / "ComponentJs.vue"]
     ts_root, ts_language = updater.ast_cache[project_path / "ComponentTs.vue"]
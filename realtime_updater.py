@@ -110,7 +110,11 @@ def start_watcher(repo_path: str, host: str, port: int) -> None:
     parsers, queries = load_parsers()
 
     with MemgraphIngestor(host=host, port=port) as ingestor:
-        updater = GraphUpdater(ingestor, repo_path_obj, parsers, queries)
+        # The watcher re-derives CALLS edges from updater.ast_cache on every
+        # change, which a graph-cache replay would leave empty.
+        updater = GraphUpdater(
+            ingestor, repo_path_obj, parsers, queries, incremental=False
+        )
 
         # --- Perform an initial full scan to build the complete context ---
         # This is essential for the real-time updates to have a valid baseline.